@@ -27,16 +27,24 @@ A client for AWS Batch services
 from __future__ import annotations
 
 import asyncio
+import json
+import re
+from itertools import islice
 from random import uniform
-from time import sleep
-from typing import Any
+from time import monotonic, sleep
+from typing import Any, AsyncIterator, Callable
+from uuid import uuid4
 
 import botocore.client
 import botocore.exceptions
+import botocore.paginate
 import botocore.waiter
+from botocore.config import Config
 
+from airflow.compat.functools import cached_property
 from airflow.exceptions import AirflowException
 from airflow.providers.amazon.aws.hooks.base_aws import AwsBaseAsyncHook, AwsBaseHook
+from airflow.providers.amazon.aws.hooks.sqs import SqsHook
 from airflow.typing_compat import Protocol, runtime_checkable
 
 
@@ -63,6 +71,17 @@ class BatchProtocol(Protocol):
         """
         ...
 
+    def get_paginator(self, operation_name: str) -> botocore.paginate.Paginator:
+        """
+        Get an AWS Batch service paginator
+
+        :param operation_name: The operation name, as the method name on the client,
+            e.g. 'list_jobs'
+
+        :return: a paginator object for the named AWS Batch operation
+        """
+        ...
+
     def get_waiter(self, waiterName: str) -> botocore.waiter.Waiter:
         """
         Get an AWS Batch service waiter
@@ -137,15 +156,43 @@ class BatchProtocol(Protocol):
 # all the Airflow wrappers of boto3 clients should not adopt invalid-names to match boto3.
 
 
+def _get_awslogs_info(job_container_desc: dict, default_region: str) -> dict[str, str]:
+    """Extract AWS CloudWatch information from a job container using the ``awslogs`` log driver."""
+    # Try to get user-defined log configuration options
+    log_options = job_container_desc.get("logConfiguration", {}).get("options", {})
+
+    return {
+        "awslogs_stream_name": job_container_desc["logStreamName"],
+        "awslogs_group": log_options.get("awslogs-group", "/aws/batch/job"),
+        "awslogs_region": log_options.get("awslogs-region", default_region),
+    }
+
+
+# Log drivers with AWS CloudWatch logging: logDriver -> handler(job_container_desc, default_region)
+_LOG_DRIVER_HANDLERS: dict[str, Callable[[dict, str], dict[str, str]]] = {
+    "awslogs": _get_awslogs_info,
+}
+
+# Exponential back-off delays, 1 + (tries * 0.6) ** 2, which reach the maximum interval
+# of 10 minutes (which results in 5 to 10 minute delay) after 41 tries
+_EXPONENTIAL_DELAYS = tuple(min(600.0, 1 + pow(tries * 0.6, 2)) for tries in range(42))
+
+# Counts of unfinished jobs, shared by all hooks in the process and keyed by
+# (aws_conn_id, region_name, job_queue, status_filter) -> (monotonic timestamp, count)
+_UNFINISHED_JOBS_CACHE: dict[tuple[str | None, str | None, str, str | None], tuple[float, int]] = {}
+
+
 class BatchClientHook(AwsBaseHook):
     """
     Interact with AWS Batch.
     Provide thick wrapper around :external+boto3:py:class:`boto3.client("batch") <Batch.Client>`.
 
-    :param max_retries: exponential back-off retries, 4200 = 48 hours;
-        polling is only used when waiters is None
+    :param max_retries: exponential back-off retries, 4200 = about 3 weeks
+        (each back-off delay is capped at 10 minutes);
+        the job running/complete waiters make at most ``max_retries`` status checks
     :param status_retries: number of HTTP retries to get job status, 10;
-        polling is only used when waiters is None
+        used as ``max_attempts`` of the botocore ``adaptive`` retry mode,
+        unless retries are configured for the connection
 
     .. note::
         Several methods use a default random delay to check or poll for job status, i.e.
@@ -182,9 +229,17 @@ class BatchClientHook(AwsBaseHook):
     DEFAULT_DELAY_MIN = 1
     DEFAULT_DELAY_MAX = 10
 
+    # the dynamic delay adds 1 second per this many running jobs in the job queue
+    DYNAMIC_DELAY_JOBS_PER_SECOND = 10
+    # seconds to reuse a count of unfinished jobs before listing the jobs again
+    UNFINISHED_JOBS_CACHE_TTL = 5
+    # the maximum number of jobs counted per job status, i.e. at most 10 list_jobs requests
+    UNFINISHED_JOBS_COUNT_LIMIT = 1000
+
     FAILURE_STATE = "FAILED"
     SUCCESS_STATE = "SUCCEEDED"
     RUNNING_STATE = "RUNNING"
+    TERMINAL_STATES = (SUCCESS_STATE, FAILURE_STATE)
     INTERMEDIATE_STATES = (
         "SUBMITTED",
         "PENDING",
@@ -193,6 +248,12 @@ class BatchClientHook(AwsBaseHook):
         RUNNING_STATE,
     )
 
+    # names of the waiters used by poll_for_job_running and poll_for_job_complete
+    JOB_RUNNING_WAITER = "batch_job_running"
+    JOB_COMPLETE_WAITER = "batch_job_complete"
+    # the number of status checks per waiter stage, i.e. between increases of the delay
+    WAITER_STAGE_ATTEMPTS = 5
+
     COMPUTE_ENVIRONMENT_TERMINAL_STATUS = ("VALID", "DELETED")
     COMPUTE_ENVIRONMENT_INTERMEDIATE_STATUS = ("CREATING", "UPDATING", "DELETING")
 
@@ -206,16 +267,46 @@ class BatchClientHook(AwsBaseHook):
         super().__init__(client_type="batch", *args, **kwargs)  # type: ignore
         self.max_retries = max_retries or self.MAX_RETRIES
         self.status_retries = status_retries or self.STATUS_RETRIES
+        # descriptions of jobs in a terminal state, which no longer change
+        self._job_cache: dict[str, dict] = {}
 
     @property
+    def config(self) -> Config:
+        """
+        Configuration for botocore client read-only property.
+
+        Unless retries are configured (e.g. in the connection ``config_kwargs``), the
+        botocore ``adaptive`` retry mode is used with ``status_retries`` max attempts;
+        it rate limits requests client-side and retries throttled API requests, such
+        as ``TooManyRequestsException`` errors from ``describe_jobs``.
+
+        .. seealso::
+            - https://boto3.amazonaws.com/v1/documentation/api/latest/guide/retries.html
+        """
+        config = super().config
+        if config.retries is None:
+            config = config.merge(Config(retries={"mode": "adaptive", "max_attempts": self.status_retries}))
+        return config
+
+    @cached_property
     def client(self) -> BatchProtocol | botocore.client.BaseClient:
         """
-        An AWS API client for Batch services.
+        An AWS API client for Batch services (cached).
 
         :return: a boto3 'batch' client for the ``.region_name``
         """
         return self.conn
 
+    @cached_property
+    def conn_region_name(self) -> str:
+        """
+        Get actual AWS Region Name from Hook connection (cached).
+
+        The region is resolved once, on first use, from the client metadata
+        instead of walking it on every :py:meth:`.get_job_awslogs_info` call.
+        """
+        return super().conn_region_name
+
     def terminate_job(self, job_id: str, reason: str) -> dict:
         """
         Terminate a Batch job
@@ -240,9 +331,20 @@ class BatchClientHook(AwsBaseHook):
 
         :raises: AirflowException
         """
-        job = self.get_job_description(job_id)
-        job_status = job.get("status")
+        return self._check_job_status(job_id, self.get_job_description(job_id))
+
+    def _check_job_status(self, job_id: str, job: dict) -> bool:
+        """
+        Check the status of a Batch job description; return True if the job
+        'SUCCEEDED', else raise an AirflowException
+
+        :param job_id: a Batch job ID
+
+        :param job: an API response to describe job_id
 
+        :raises: AirflowException
+        """
+        job_status = job.get("status")
         if job_status == self.SUCCESS_STATE:
             self.log.info("AWS Batch job (%s) succeeded: %s", job_id, job)
             return True
@@ -255,7 +357,7 @@ class BatchClientHook(AwsBaseHook):
 
         raise AirflowException(f"AWS Batch job ({job_id}) has unknown status: {job}")
 
-    def wait_for_job(self, job_id: str, delay: int | float | None = None) -> None:
+    def wait_for_job(self, job_id: str, delay: int | float | None = None, event_driven: bool = False) -> None:
         """
         Wait for Batch job to complete
 
@@ -263,13 +365,122 @@ class BatchClientHook(AwsBaseHook):
 
         :param delay: a delay before polling for job status
 
+        :param event_driven: wait for the Amazon EventBridge events of the job
+            instead of polling for job status, see :py:meth:`.wait_for_job_events`
+
         :raises: AirflowException
+
+        .. note::
+            If the job is already complete ('SUCCEEDED'|'FAILED'), this returns
+            after a single job description request.
         """
-        self.delay(delay)
-        self.poll_for_job_running(job_id, delay)
-        self.poll_for_job_complete(job_id, delay)
+        if event_driven:
+            self.wait_for_job_events(job_id)
+        elif self.get_job_description(job_id).get("status") not in self.TERMINAL_STATES:
+            self.delay(delay)
+            self.poll_for_job_running(job_id, delay)
+            self.poll_for_job_complete(job_id, delay)
         self.log.info("AWS Batch job (%s) has completed", job_id)
 
+    def wait_for_job_events(self, job_id: str) -> None:
+        """
+        Wait for Batch job to complete, using Amazon EventBridge instead of polling
+        ``describe_jobs``.
+
+        A temporary EventBridge rule sends the "Batch Job State Change" events of the job
+        to a temporary SQS queue, which is long-polled until the job status is
+        'SUCCEEDED'|'FAILED'.  The rule and the queue are deleted afterwards.  This requires
+        permissions to manage EventBridge rules and SQS queues.
+
+        The wait has the same budget as polling for ``max_retries`` status checks, i.e. the
+        sum of their (maximum) exponential back-off delays.  The EventBridge and SQS clients
+        use the same connection, ``verify`` and botocore ``config`` as the Batch client.
+
+        :param job_id: a Batch job ID
+
+        :raises: AirflowException
+        """
+        hook_kwargs = {
+            "aws_conn_id": self.aws_conn_id,
+            "region_name": self.region_name,
+            "verify": self.verify,
+            "config": self.config,
+        }
+        events = AwsBaseHook(client_type="events", **hook_kwargs)
+        sqs = SqsHook(**hook_kwargs)
+        # rule names allow at most 64 characters and queue names at most 80 characters,
+        # neither allows the ':' and '#' of array and multi-node child job IDs
+        safe_job_id = re.sub(r"[^A-Za-z0-9_-]", "-", job_id)[:41]
+        resource_name = f"airflow-batch-{safe_job_id}-{uuid4().hex[:8]}"
+
+        queue_url = sqs.create_queue(resource_name)["QueueUrl"]
+        try:
+            queue_attributes = sqs.conn.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["QueueArn"])
+            queue_arn = queue_attributes["Attributes"]["QueueArn"]
+            event_pattern = {
+                "source": ["aws.batch"],
+                "detail-type": ["Batch Job State Change"],
+                "detail": {"jobId": [job_id]},
+            }
+            rule = events.conn.put_rule(Name=resource_name, EventPattern=json.dumps(event_pattern))
+            rule_arn = rule["RuleArn"]
+            queue_policy = {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": {"Service": "events.amazonaws.com"},
+                        "Action": "sqs:SendMessage",
+                        "Resource": queue_arn,
+                        "Condition": {"ArnEquals": {"aws:SourceArn": rule_arn}},
+                    }
+                ],
+            }
+            sqs.conn.set_queue_attributes(QueueUrl=queue_url, Attributes={"Policy": json.dumps(queue_policy)})
+            events.conn.put_targets(Rule=resource_name, Targets=[{"Id": resource_name, "Arn": queue_arn}])
+
+            # The job could complete before the rule was created, so check the status once
+            job_status = self.get_job_description(job_id).get("status")
+            budget = sum(
+                _EXPONENTIAL_DELAYS[min(tries, len(_EXPONENTIAL_DELAYS) - 1)]
+                for tries in range(self.max_retries)
+            )
+            deadline = monotonic() + budget
+            while job_status not in self.TERMINAL_STATES:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise AirflowException(f"AWS Batch job ({job_id}) state change waits exceed max_retries")
+
+                response = sqs.conn.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=10,
+                    WaitTimeSeconds=max(1, min(20, int(remaining))),
+                )
+                for message in response.get("Messages", []):
+                    event_status = json.loads(message["Body"]).get("detail", {}).get("status")
+                    self.log.info("AWS Batch job (%s) state change event: %s", job_id, event_status)
+                    if event_status in self.TERMINAL_STATES:
+                        job_status = event_status
+        finally:
+            self._delete_job_events_resources(events, sqs, resource_name, queue_url)
+
+    def _delete_job_events_resources(
+        self, events: AwsBaseHook, sqs: SqsHook, resource_name: str, queue_url: str
+    ) -> None:
+        """Delete the temporary EventBridge rule and SQS queue of :py:meth:`.wait_for_job_events`."""
+        cleanup_calls: list[tuple[Callable, dict[str, Any]]] = [
+            (events.conn.remove_targets, {"Rule": resource_name, "Ids": [resource_name]}),
+            (events.conn.delete_rule, {"Name": resource_name}),
+            (sqs.conn.delete_queue, {"QueueUrl": queue_url}),
+        ]
+        for cleanup_call, kwargs in cleanup_calls:
+            try:
+                cleanup_call(**kwargs)
+            except botocore.exceptions.ClientError as err:
+                self.log.warning(
+                    "Unable to delete AWS Batch job events resource (%s): %s", resource_name, err
+                )
+
     def poll_for_job_running(self, job_id: str, delay: int | float | None = None) -> None:
         """
         Poll for job running. The status that indicates a job is running or
@@ -284,13 +495,12 @@ class BatchClientHook(AwsBaseHook):
 
         :param job_id: a Batch job ID
 
-        :param delay: a delay before polling for job status
+        :param delay: a delay before polling for job status;
+            the status checks that follow back off exponentially
 
         :raises: AirflowException
         """
-        self.delay(delay)
-        running_status = [self.RUNNING_STATE, self.SUCCESS_STATE, self.FAILURE_STATE]
-        self.poll_job_status(job_id, running_status)
+        self._wait_for_job_status(self.JOB_RUNNING_WAITER, job_id, delay)
 
     def poll_for_job_complete(self, job_id: str, delay: int | float | None = None) -> None:
         """
@@ -302,13 +512,129 @@ class BatchClientHook(AwsBaseHook):
 
         :param job_id: a Batch job ID
 
+        :param delay: a delay before polling for job status;
+            the status checks that follow back off exponentially
+
+        :raises: AirflowException
+        """
+        self._wait_for_job_status(self.JOB_COMPLETE_WAITER, job_id, delay)
+
+    def _wait_for_job_status(self, waiter_name: str, job_id: str, delay: int | float | None = None) -> None:
+        """
+        Wait for the job status using the ``JOB_RUNNING_WAITER`` or ``JOB_COMPLETE_WAITER``
+        (by default, the custom waiters in ``waiters/batch.json``), with an exponential
+        back-off strategy (with max_retries).
+
+        The waiter runs in stages of ``WAITER_STAGE_ATTEMPTS`` status checks; the delay
+        between the checks of a stage, and before the next stage, grows with the number
+        of status checks made and with the number of jobs running in the job queue; it is
+        recomputed for each stage (see :py:meth:`.dynamic_delay`).
+
+        :param waiter_name: the name of a custom Batch waiter
+
+        :param job_id: a Batch job ID
+
         :param delay: a delay before polling for job status
 
         :raises: AirflowException
         """
         self.delay(delay)
-        complete_status = [self.SUCCESS_STATE, self.FAILURE_STATE]
-        self.poll_job_status(job_id, complete_status)
+        waiter = self.get_waiter(waiter_name)
+        retries = 0
+        job_queue = None  # known from the last response of the first stage
+        while True:
+            stage_attempts = min(self.WAITER_STAGE_ATTEMPTS, self.max_retries + 1 - retries)
+            pause = self.dynamic_delay(retries + (stage_attempts + 1) // 2, job_queue)
+            try:
+                waiter.wait(jobs=[job_id], WaiterConfig={"Delay": pause, "MaxAttempts": stage_attempts})
+                return
+            except botocore.exceptions.WaiterError as err:
+                if not str(err.kwargs.get("reason", "")).startswith("Max attempts exceeded"):
+                    raise AirflowException(f"AWS Batch job ({job_id}) status checks failed: {err}")
+                jobs = (err.last_response or {}).get("jobs") or [{}]
+                job_queue = jobs[0].get("jobQueue")
+
+            retries += stage_attempts
+            if retries > self.max_retries:
+                raise AirflowException(f"AWS Batch job ({job_id}) status checks exceed max_retries")
+
+            self.log.info(
+                "AWS Batch job (%s) status check (%d of %d) in the next %.2f seconds",
+                job_id,
+                retries,
+                self.max_retries,
+                pause,
+            )
+            self.delay(pause)
+
+    def unfinished_jobs(self, job_queue: str, status_filter: str | None = None) -> int:
+        """
+        Count the unfinished jobs in a job queue; the count is cached for
+        ``UNFINISHED_JOBS_CACHE_TTL`` seconds and shared by all hooks in the process
+        (but not across processes).
+
+        To bound the cost of listing the jobs, at most ``UNFINISHED_JOBS_COUNT_LIMIT``
+        jobs are counted for each job status.
+
+        :param job_queue: the queue name (or ARN) on AWS Batch
+
+        :param status_filter: a job status to count, e.g. 'RUNNING';
+            if None, jobs in any of the ``INTERMEDIATE_STATES`` are counted
+
+        :return: the number of unfinished jobs in the job queue
+        """
+        cache_key = (self.aws_conn_id, self.region_name, job_queue, status_filter)
+        cached = _UNFINISHED_JOBS_CACHE.get(cache_key)
+        if cached and monotonic() - cached[0] < self.UNFINISHED_JOBS_CACHE_TTL:
+            return cached[1]
+
+        paginator = self.client.get_paginator("list_jobs")
+        count = 0
+        for job_status in [status_filter] if status_filter else self.INTERMEDIATE_STATES:
+            pages = paginator.paginate(
+                jobQueue=job_queue,
+                jobStatus=job_status,
+                PaginationConfig={"MaxItems": self.UNFINISHED_JOBS_COUNT_LIMIT, "PageSize": 100},
+            )
+            for page in pages:
+                count += len(page.get("jobSummaryList", []))
+
+        _UNFINISHED_JOBS_CACHE[cache_key] = (monotonic(), count)
+        return count
+
+    def dynamic_delay(self, tries: int, job_queue: str | None = None) -> float:
+        """
+        An exponential back-off delay that also grows with the number of jobs running
+        in the job queue, i.e. :py:meth:`.exponential_delay` plus one second for every
+        ``DYNAMIC_DELAY_JOBS_PER_SECOND`` running jobs; this spreads out the
+        ``describe_jobs`` requests of tasks waiting on a busy job queue.
+
+        If the job queue is unknown, or the running jobs cannot be listed
+        (e.g. ``batch:ListJobs`` is not allowed), only the exponential back-off delay is used.
+
+        .. note::
+            Counting the running jobs costs up to ``UNFINISHED_JOBS_COUNT_LIMIT / 100``
+            ``list_jobs`` requests, unless the count is cached (see :py:meth:`.unfinished_jobs`).
+
+        :param tries: Number of tries
+
+        :param job_queue: the queue name (or ARN) of the job on AWS Batch
+
+        :return: a delay in seconds
+        """
+        delay = self.exponential_delay(tries)
+        if not job_queue:
+            return delay
+        try:
+            running_jobs = self.unfinished_jobs(job_queue, self.RUNNING_STATE)
+        except botocore.exceptions.ClientError as err:
+            self.log.warning(
+                "AWS Batch job queue (%s) unable to count running jobs, using the default delay: %s",
+                job_queue,
+                err,
+            )
+            return delay
+        return delay + running_jobs / self.DYNAMIC_DELAY_JOBS_PER_SECOND
 
     def poll_job_status(self, job_id: str, match_status: list[str]) -> bool:
         """
@@ -353,7 +679,11 @@ class BatchClientHook(AwsBaseHook):
 
     def get_job_description(self, job_id: str) -> dict:
         """
-        Get job description (using status_retries).
+        Get job description; throttled requests are retried by botocore
+        (see :py:attr:`.config`).
+
+        The description of a job in a terminal state ('SUCCEEDED'|'FAILED') does not
+        change anymore, so it is cached and returned without another API request.
 
         :param job_id: a Batch job ID
 
@@ -361,39 +691,14 @@ class BatchClientHook(AwsBaseHook):
 
         :raises: AirflowException
         """
-        retries = 0
-        while True:
-            try:
-                response = self.get_conn().describe_jobs(jobs=[job_id])
-                return self.parse_job_description(job_id, response)
-
-            except botocore.exceptions.ClientError as err:
-                # Allow it to retry in case of exceeded quota limit of requests to AWS API
-                if err.response.get("Error", {}).get("Code") != "TooManyRequestsException":
-                    raise
-                self.log.warning(
-                    "Ignored TooManyRequestsException error, original message: %r. "
-                    "Please consider to setup retries mode in boto3, "
-                    "check Amazon Provider AWS Connection documentation for more details.",
-                    str(err),
-                )
-
-            retries += 1
-            if retries >= self.status_retries:
-                raise AirflowException(
-                    f"AWS Batch job ({job_id}) description error: exceeded status_retries "
-                    f"({self.status_retries})"
-                )
+        if job_id in self._job_cache:
+            return self._job_cache[job_id]
 
-            pause = self.exponential_delay(retries)
-            self.log.info(
-                "AWS Batch job (%s) description retry (%d of %d) in the next %.2f seconds",
-                job_id,
-                retries,
-                self.status_retries,
-                pause,
-            )
-            self.delay(pause)
+        response = self.get_conn().describe_jobs(jobs=[job_id])
+        job = self.parse_job_description(job_id, response)
+        if job.get("status") in self.TERMINAL_STATES:
+            self._job_cache[job_id] = job
+        return job
 
     @staticmethod
     def parse_job_description(job_id: str, response: dict) -> dict:
@@ -431,28 +736,21 @@ class BatchClientHook(AwsBaseHook):
         #   awslogs-group = /aws/batch/job
         #   awslogs-region = `same as AWS Batch Job region`
         log_driver = log_configuration.get("logDriver", "awslogs")
-        if log_driver != "awslogs":
+        get_logs_info = _LOG_DRIVER_HANDLERS.get(log_driver)
+        if get_logs_info is None:
             self.log.warning(
                 "AWS Batch job (%s) uses logDriver (%s). AWS CloudWatch logging disabled.", job_id, log_driver
             )
             return None
 
-        awslogs_stream_name = job_container_desc.get("logStreamName")
-        if not awslogs_stream_name:
+        if not job_container_desc.get("logStreamName"):
             # In case of call this method on very early stage of running AWS Batch
             # there is possibility than AWS CloudWatch Stream Name not exists yet.
             # AWS CloudWatch Stream Name also not created in case of misconfiguration.
             self.log.warning("AWS Batch job (%s) doesn't create AWS CloudWatch Stream.", job_id)
             return None
 
-        # Try to get user-defined log configuration options
-        log_options = log_configuration.get("options", {})
-
-        return {
-            "awslogs_stream_name": awslogs_stream_name,
-            "awslogs_group": log_options.get("awslogs-group", "/aws/batch/job"),
-            "awslogs_region": log_options.get("awslogs-region", self.conn_region_name),
-        }
+        return get_logs_info(job_container_desc, self.conn_region_name)
 
     @staticmethod
     def add_jitter(delay: int | float, width: int | float = 1, minima: int | float = 0) -> float:
@@ -505,8 +803,9 @@ class BatchClientHook(AwsBaseHook):
     @staticmethod
     def exponential_delay(tries: int) -> float:
         """
-        An exponential back-off delay, with random jitter.  There is a maximum
-        interval of 10 minutes (with random jitter between 3 and 10 minutes).
+        An exponential back-off delay, with "equal jitter", i.e. half of the delay is fixed
+        and the other half is random.  There is a maximum interval of 10 minutes (with
+        random jitter between 5 and 10 minutes).
         This is used in the :py:meth:`.poll_for_job_status` method.
 
         :param tries: Number of tries
@@ -520,32 +819,30 @@ class BatchClientHook(AwsBaseHook):
                 max_interval = 600.0  # 10 minutes in seconds
                 delay = 1 + pow(tries * 0.6, 2)
                 delay = min(max_interval, delay)
-                print(delay / 3, delay)
+                print(delay / 2, delay)
 
 
             for tries in range(10):
                 exp(tries)
 
-            #  0.33  1.0
-            #  0.45  1.35
-            #  0.81  2.44
-            #  1.41  4.23
-            #  2.25  6.76
-            #  3.33 10.00
-            #  4.65 13.95
-            #  6.21 18.64
-            #  8.01 24.04
-            # 10.05 30.15
+            #  0.50  1.00
+            #  0.68  1.36
+            #  1.22  2.44
+            #  2.12  4.24
+            #  3.38  6.76
+            #  5.00 10.00
+            #  6.98 13.96
+            #  9.32 18.64
+            # 12.02 24.04
+            # 15.08 30.16
 
         .. seealso::
 
             - https://docs.aws.amazon.com/general/latest/gr/api-retries.html
             - https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
         """
-        max_interval = 600.0  # results in 3 to 10 minute delay
-        delay = 1 + pow(tries * 0.6, 2)
-        delay = min(max_interval, delay)
-        return uniform(delay / 3, delay)
+        delay = _EXPONENTIAL_DELAYS[min(tries, len(_EXPONENTIAL_DELAYS) - 1)]
+        return delay / 2 + uniform(0, delay / 2)
 
 
 class BatchClientAsyncHook(BatchClientHook, AwsBaseAsyncHook):
@@ -612,19 +909,7 @@ class BatchClientAsyncHook(BatchClientHook, AwsBaseAsyncHook):
 
         :raises: AirflowException
         """
-        job = await self.get_job_description(job_id)
-        job_status = job.get("status")
-        if job_status == self.SUCCESS_STATE:
-            self.log.info("AWS Batch job (%s) succeeded: %s", job_id, job)
-            return True
-
-        if job_status == self.FAILURE_STATE:
-            raise AirflowException(f"AWS Batch job ({job_id}) failed: {job}")
-
-        if job_status in self.INTERMEDIATE_STATES:
-            raise AirflowException(f"AWS Batch job ({job_id}) is not complete: {job}")
-
-        raise AirflowException(f"AWS Batch job ({job_id}) has unknown status: {job}")
+        return self._check_job_status(job_id, await self.get_job_description(job_id))
 
     @staticmethod
     async def delay(delay: int | float | None = None) -> None:  # type: ignore[override]
@@ -663,6 +948,55 @@ class BatchClientAsyncHook(BatchClientHook, AwsBaseAsyncHook):
         await self.poll_for_job_complete(job_id, delay)
         self.log.info("AWS Batch job (%s) has completed", job_id)
 
+    async def wait_for_jobs(
+        self, job_ids: list[str], delay: int | float | None = None
+    ) -> AsyncIterator[tuple[str, str]]:
+        """
+        Wait for Batch jobs to complete; yield ``(job_id, status)`` as each job
+        completes with the status 'SUCCEEDED'|'FAILED'.
+
+        Each status check describes all the pending jobs at once, in batched
+        ``describe_jobs`` requests of up to 100 job IDs, so the request rate does not
+        grow with the number of jobs awaited.
+
+        :param job_ids: a list of Batch job IDs
+
+        :param delay: a delay between status checks
+
+        :raises: AirflowException
+        """
+        pending = list(dict.fromkeys(job_ids))
+        retries = 0
+        while True:
+            jobs = await asyncio.gather(*(self.get_job_description(job_id) for job_id in pending))
+            completed = [
+                (job_id, job["status"])
+                for job_id, job in zip(pending, jobs)
+                if job.get("status") in self.TERMINAL_STATES
+            ]
+            for job_id, job_status in completed:
+                self.log.info("AWS Batch job (%s) has completed: %s", job_id, job_status)
+                yield job_id, job_status
+
+            completed_ids = {job_id for job_id, _ in completed}
+            pending = [job_id for job_id in pending if job_id not in completed_ids]
+            if not pending:
+                return
+
+            if retries >= self.max_retries:
+                raise AirflowException(
+                    f"AWS Batch jobs ({', '.join(pending)}) status checks exceed max_retries"
+                )
+
+            retries += 1
+            self.log.info(
+                "AWS Batch jobs status check (%d of %d): %d jobs pending",
+                retries,
+                self.max_retries,
+                len(pending),
+            )
+            await self.delay(delay)
+
     async def poll_for_job_complete(  # type: ignore[override]
         self, job_id: str, delay: int | float | None = None
     ) -> None:
@@ -709,41 +1043,19 @@ class BatchClientAsyncHook(BatchClientHook, AwsBaseAsyncHook):
 
     async def get_job_description(self, job_id: str) -> dict[str, str]:  # type: ignore[override]
         """
-        Get job description (using status_retries).
+        Get job description; throttled requests are retried by aiobotocore
+        (see :py:attr:`.config`).
+
+        Concurrent calls in the same event loop (e.g. from many triggers in the Triggerer)
+        are coalesced into ``describe_jobs`` requests of up to 100 job IDs.
 
         :param job_id: a Batch job ID
         :raises: AirflowException
         """
-        retries = 0
-        async with await self.get_client_async() as client:
-            while True:
-                try:
-                    response = client.describe_jobs(jobs=[job_id])
-                    return self.parse_job_description(job_id, response)
-
-                except botocore.exceptions.ClientError as err:
-                    error = err.response.get("Error", {})
-                    if error.get("Code") == "TooManyRequestsException":
-                        pass  # allow it to retry, if possible
-                    else:
-                        raise AirflowException(f"AWS Batch job ({job_id}) description error: {err}")
-
-                retries += 1
-                if retries >= self.status_retries:
-                    raise AirflowException(
-                        f"AWS Batch job ({job_id}) description error: exceeded status_retries "
-                        f"({self.status_retries})"
-                    )
-
-                pause = self.exponential_delay(retries)
-                self.log.info(
-                    "AWS Batch job (%s) description retry (%d of %d) in the next %.2f seconds",
-                    job_id,
-                    retries,
-                    self.status_retries,
-                    pause,
-                )
-                await self.delay(pause)
+        try:
+            return await _PendingJobRegistry.for_hook(self).register(job_id)
+        except botocore.exceptions.ClientError as err:
+            raise AirflowException(f"AWS Batch job ({job_id}) description error: {err}")
 
     async def poll_job_status(self, job_id: str, match_status: list[str]) -> bool:  # type: ignore[override]
         """
@@ -781,3 +1093,96 @@ class BatchClientAsyncHook(BatchClientHook, AwsBaseAsyncHook):
                 pause,
             )
             await self.delay(pause)
+
+
+class _PendingJobRegistry:
+    """
+    Coalesce the ``describe_jobs`` requests of concurrent awaiters in one event loop
+    into batched requests of up to ``MAX_JOBS_PER_REQUEST`` job IDs.
+
+    There is one registry per AWS connection, region, ``verify`` setting and endpoint URL
+    in the running event loop.  Its ``describe_jobs`` requests use a client created from
+    the first hook registered for that key, so other client settings of later hooks
+    (e.g. a custom botocore ``config``) do not apply to these requests.
+
+    Pending job IDs are flushed as soon as the event loop is free, so a single
+    pending job ID is described without extra latency; any job IDs registered while
+    a request is in flight are described together in the next request.
+
+    :param hook: the hook used to create the aiobotocore client
+    """
+
+    MAX_JOBS_PER_REQUEST = 100
+
+    def __init__(self, hook: BatchClientAsyncHook) -> None:
+        self.hook = hook
+        self.loop = asyncio.get_running_loop()
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    @classmethod
+    def for_hook(cls, hook: BatchClientAsyncHook) -> _PendingJobRegistry:
+        """Get the registry for the hook's client settings in the running event loop."""
+        key = (hook.aws_conn_id, hook.region_name, hook.verify, hook.conn_config.endpoint_url)
+        registry = _PENDING_JOB_REGISTRIES.get(key)
+        if registry is None or registry.loop is not asyncio.get_running_loop():
+            registry = _PENDING_JOB_REGISTRIES[key] = cls(hook)
+        return registry
+
+    async def register(self, job_id: str) -> dict:
+        """
+        Wait for the next batched ``describe_jobs`` request that includes the job ID.
+
+        :param job_id: a Batch job ID
+
+        :return: an API response to describe job_id
+
+        :raises: AirflowException or the ``describe_jobs`` error
+        """
+        future = self.loop.create_future()
+        self._pending.setdefault(job_id, []).append(future)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.loop.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        # yield once, so the awaiters woken up in the same loop iteration join the first request
+        await asyncio.sleep(0)
+        while self._pending:
+            job_ids = list(islice(self._pending, self.MAX_JOBS_PER_REQUEST))
+            futures = {job_id: self._pending.pop(job_id) for job_id in job_ids}
+            try:
+                async with await self.hook.get_client_async() as client:
+                    response = await client.describe_jobs(jobs=job_ids)
+            except Exception as err:
+                for job_id, job_futures in futures.items():
+                    self._resolve(job_futures, exception=err)
+                continue
+
+            jobs = {job.get("jobId"): job for job in response.get("jobs", [])}
+            for job_id, job_futures in futures.items():
+                if job_id in jobs:
+                    self._resolve(job_futures, result=jobs[job_id])
+                else:
+                    error = AirflowException(
+                        f"AWS Batch job ({job_id}) description error: response: {response}"
+                    )
+                    self._resolve(job_futures, exception=error)
+
+    @staticmethod
+    def _resolve(
+        futures: list[asyncio.Future], result: dict | None = None, exception: BaseException | None = None
+    ) -> None:
+        for future in futures:
+            if future.done():  # the awaiter was cancelled
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+# (aws_conn_id, region_name, verify, endpoint_url) -> registry
+_PENDING_JOB_REGISTRIES: dict[
+    tuple[str | None, str | None, bool | str | None, str | None], _PendingJobRegistry
+] = {}
@@ -96,6 +96,10 @@ class BatchWaitersHook(BatchClientHook):
         Override the AWS region in connection (if provided)
     """
 
+    # the inherited poll_for_job_running and poll_for_job_complete use the waiter_model
+    JOB_RUNNING_WAITER = "JobRunning"
+    JOB_COMPLETE_WAITER = "JobComplete"
+
     def __init__(self, *args, waiter_config: dict | None = None, **kwargs) -> None:
 
         super().__init__(*args, **kwargs)
@@ -182,7 +186,7 @@ class BatchWaitersHook(BatchClientHook):
         """
         return self.waiter_model.waiter_names
 
-    def wait_for_job(self, job_id: str, delay: int | float | None = None) -> None:
+    def wait_for_job(self, job_id: str, delay: int | float | None = None, event_driven: bool = False) -> None:
         """
         Wait for Batch job to complete.  This assumes that the ``.waiter_model`` is configured
         using some variation of the ``.default_config`` so that it can generate waiters with the
@@ -192,6 +196,9 @@ class BatchWaitersHook(BatchClientHook):
 
         :param delay:  A delay before polling for job status
 
+        :param event_driven: wait for the Amazon EventBridge events of the job
+            instead of using the waiters, see :py:meth:`.BatchClientHook.wait_for_job_events`
+
         :raises: AirflowException
 
         .. note::
@@ -202,6 +209,10 @@ class BatchWaitersHook(BatchClientHook):
             It also modifies the ``max_attempts`` to use the ``sys.maxsize``,
             which allows Airflow to manage the timeout on waiting.
         """
+        if event_driven:
+            self.wait_for_job_events(job_id)
+            return
+
         self.delay(delay)
         try:
             waiter = self.get_waiter("JobExists")
@@ -37,7 +37,7 @@ from airflow.providers.amazon.aws.links.batch import (
     BatchJobQueueLink,
 )
 from airflow.providers.amazon.aws.links.logs import CloudWatchEventsLink
-from airflow.providers.amazon.aws.triggers.batch import BatchOperatorTrigger
+from airflow.providers.amazon.aws.triggers.batch import BatchJobTrigger
 from airflow.providers.amazon.aws.utils import trim_none_values
 
 if TYPE_CHECKING:
@@ -62,17 +62,22 @@ class BatchOperator(BaseOperator):
         submit_job operation gets the jobId defined by AWS Batch
     :param waiters: an :py:class:`.BatchWaiters` object (see note below);
         if None, polling is used with max_retries and status_retries.
-    :param max_retries: exponential back-off retries, 4200 = 48 hours;
-        polling is only used when waiters is None
+    :param max_retries: exponential back-off retries, 4200 = about 3 weeks
+        (each back-off delay is capped at 10 minutes);
+        at most ``max_retries`` job status checks are made, unless custom waiters are used
     :param status_retries: number of HTTP retries to get job status, 10;
-        polling is only used when waiters is None
+        used as ``max_attempts`` of the botocore ``adaptive`` retry mode,
+        unless retries are configured for the connection
     :param aws_conn_id: connection id of AWS credentials / region name. If None,
         credential boto3 strategy will be used.
     :param region_name: region name to use in AWS Hook.
         Override the region_name in connection (if provided)
     :param tags: collection of tags to apply to the AWS Batch job submission
         if None, no tags are submitted
-    :param deferrable: Run operator in the deferrable mode.
+    :param deferrable: Run operator in the deferrable mode; custom ``waiters``
+        are not used in deferrable mode.
+    :param poll_interval: (Deferrable mode only) Time in seconds to wait between
+        status checks of the job in the Triggerer.
 
     .. note::
         Any custom waiters must return a waiter for these calls:
@@ -128,6 +133,7 @@ class BatchOperator(BaseOperator):
         tags: dict | None = None,
         wait_for_completion: bool = True,
         deferrable: bool = False,
+        poll_interval: int = 30,
         **kwargs,
     ):
 
@@ -143,6 +149,7 @@ class BatchOperator(BaseOperator):
         self.tags = tags or {}
         self.wait_for_completion = wait_for_completion
         self.deferrable = deferrable
+        self.poll_interval = poll_interval
 
         self.hook = BatchClientHook(
             max_retries=max_retries,
@@ -160,22 +167,23 @@ class BatchOperator(BaseOperator):
         self.submit_job(context)
 
         if self.deferrable:
+            if not self.job_id:
+                raise AirflowException("AWS Batch job - job_id was not found")
+            if self.waiters:
+                self.log.warning(
+                    "AWS Batch job (%s) custom waiters are not used in deferrable mode; "
+                    "the job status is polled in the Triggerer every %s seconds",
+                    self.job_id,
+                    self.poll_interval,
+                )
             self.defer(
                 timeout=self.execution_timeout,
-                trigger=BatchOperatorTrigger(
+                trigger=BatchJobTrigger(
                     job_id=self.job_id,
-                    job_name=self.job_name,
-                    job_definition=self.job_definition,
-                    job_queue=self.job_queue,
-                    overrides=self.overrides,
-                    array_properties=self.array_properties,
-                    parameters=self.parameters,
-                    waiters=self.waiters,
-                    tags=self.tags,
                     max_retries=self.hook.max_retries,
-                    status_retries=self.hook.status_retries,
                     aws_conn_id=self.hook.aws_conn_id,
                     region_name=self.hook.region_name,
+                    poll_interval=self.poll_interval,
                 ),
                 method_name="execute_complete",
             )
@@ -328,11 +336,12 @@ class BatchCreateComputeEnvironmentOperator(BaseOperator):
     :param tags: the tags that you apply to the compute-environment to help you categorize and organize your
         resources
 
-    :param max_retries: exponential back-off retries, 4200 = 48 hours;
-        polling is only used when waiters is None
+    :param max_retries: exponential back-off retries, 4200 = about 3 weeks
+        (each back-off delay is capped at 10 minutes)
 
     :param status_retries: number of HTTP retries to get job status, 10;
-        polling is only used when waiters is None
+        used as ``max_attempts`` of the botocore ``adaptive`` retry mode,
+        unless retries are configured for the connection
 
     :param aws_conn_id: connection id of AWS credentials / region name. If None,
         credential boto3 strategy will be used.
@@ -16,9 +16,11 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
+import warnings
 from typing import Any, AsyncIterator
 
-from airflow.providers.amazon.aws.hooks.batch_client import BatchClientAsyncHook
+from airflow.providers.amazon.aws.hooks.batch_client import BatchClientAsyncHook, BatchClientHook
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 
 
@@ -27,6 +29,9 @@ class BatchOperatorTrigger(BaseTrigger):
     Checks for the state of a previously submitted job to AWS Batch.
     BatchOperatorTrigger is fired as deferred class with params to poll the job state in Triggerer
 
+    This class is deprecated, please use
+    :class:`airflow.providers.amazon.aws.triggers.batch.BatchJobTrigger`.
+
     :param job_id: the job ID, usually unknown (None) until the
         submit_job operation gets the jobId defined by AWS Batch
     :param job_name: the name for the job that will run on AWS Batch (templated)
@@ -39,7 +44,8 @@ class BatchOperatorTrigger(BaseTrigger):
         if None, polling is used with max_retries and status_retries.
     :param tags: collection of tags to apply to the AWS Batch job submission
         if None, no tags are submitted
-    :param max_retries: exponential back-off retries, 4200 = 48 hours;
+    :param max_retries: exponential back-off retries, 4200 = about 3 weeks
+        (each back-off delay is capped at 10 minutes);
         polling is only used when waiters is None
     :param status_retries: number of HTTP retries to get job status, 10;
         polling is only used when waiters is None
@@ -65,6 +71,12 @@ class BatchOperatorTrigger(BaseTrigger):
         region_name: str | None,
         aws_conn_id: str | None = "aws_default",
     ):
+        warnings.warn(
+            "BatchOperatorTrigger is deprecated and will be removed in a future release. "
+            "Please use BatchJobTrigger instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         super().__init__()
         self.job_id = job_id
         self.job_name = job_name
@@ -121,3 +133,94 @@ class BatchOperatorTrigger(BaseTrigger):
                 yield TriggerEvent({"status": "error", "message": error_message})
         except Exception as e:
             yield TriggerEvent({"status": "error", "message": str(e)})
+
+
+class BatchJobTrigger(BaseTrigger):
+    """
+    Checks for the state of a previously submitted job to AWS Batch.
+    BatchJobTrigger polls ``describe_jobs`` in the Triggerer every ``poll_interval`` seconds,
+    until the job reaches a terminal status, so no worker slot is held while waiting.
+
+    :param job_id: the job ID of a submitted AWS Batch job
+    :param max_retries: the maximum number of status checks before giving up
+    :param aws_conn_id: connection id of AWS credentials / region name. If None,
+        credential boto3 strategy will be used.
+    :param region_name: AWS region name to use.
+        Override the region_name in connection (if provided)
+    :param poll_interval: number of seconds to wait between status checks
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        max_retries: int = BatchClientHook.MAX_RETRIES,
+        aws_conn_id: str | None = "aws_default",
+        region_name: str | None = None,
+        poll_interval: int = 30,
+    ):
+        super().__init__()
+        self.job_id = job_id
+        self.max_retries = max_retries
+        self.aws_conn_id = aws_conn_id
+        self.region_name = region_name
+        self.poll_interval = poll_interval
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        """Serializes BatchJobTrigger arguments and classpath."""
+        return (
+            "airflow.providers.amazon.aws.triggers.batch.BatchJobTrigger",
+            {
+                "job_id": self.job_id,
+                "max_retries": self.max_retries,
+                "aws_conn_id": self.aws_conn_id,
+                "region_name": self.region_name,
+                "poll_interval": self.poll_interval,
+            },
+        )
+
+    async def run(self) -> AsyncIterator["TriggerEvent"]:
+        """
+        Make async connection using aiobotocore library to AWS Batch,
+        periodically poll for the job status on the Triggerer; the status checks of
+        all Batch triggers in the Triggerer share batched ``describe_jobs`` requests.
+
+        The status that indicates job completion are: 'SUCCEEDED'|'FAILED'.
+        """
+        hook = BatchClientAsyncHook(
+            job_id=self.job_id, aws_conn_id=self.aws_conn_id, region_name=self.region_name
+        )
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                job = await hook.get_job_description(self.job_id)
+                job_status = job.get("status")
+
+                if job_status == hook.SUCCESS_STATE:
+                    yield TriggerEvent(
+                        {"status": "success", "message": f"AWS Batch job ({self.job_id}) succeeded"}
+                    )
+                    return
+
+                if job_status == hook.FAILURE_STATE:
+                    yield TriggerEvent(
+                        {"status": "error", "message": f"AWS Batch job ({self.job_id}) failed: {job}"}
+                    )
+                    return
+
+                self.log.info(
+                    "AWS Batch job (%s) status check (%d of %d): %s, next check in %d seconds",
+                    self.job_id,
+                    attempt,
+                    self.max_retries,
+                    job_status,
+                    self.poll_interval,
+                )
+                await asyncio.sleep(self.poll_interval)
+
+            yield TriggerEvent(
+                {
+                    "status": "error",
+                    "message": f"AWS Batch job ({self.job_id}) status checks exceed max_retries",
+                }
+            )
+        except Exception as e:
+            yield TriggerEvent({"status": "error", "message": str(e)})